@@ -5,5 +5,7 @@ NEO4J_URI = "bolt://localhost:7687"
 NEO4J_USER = "neo4j"
 NEO4J_PASSWORD = "your_password_here" 
 NEO4J_DATABASE = "warframebotdata"
+# Neo4j import directory, used by Neo4jIngestion.ingest_all_bulk (LOAD CSV)
+NEO4J_IMPORT_DIR = "/var/lib/neo4j/import"
 
 QDRANT_URL = "http://localhost:6333"
@@ -0,0 +1,42 @@
+"""
+Shared Neo4j driver for the graph scripts.
+The driver owns a connection pool, so one instance is reused per process.
+"""
+from neo4j import GraphDatabase
+import atexit
+import os
+import sys
+
+# Add parent directory to path to import config
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+
+_driver = None
+
+
+def get_driver():
+    """Return the process-wide Neo4j driver, creating it on first use."""
+    global _driver
+    if _driver is None:
+        # Pool sized for the ingestion writer threads; execute_write retries transient
+        # errors (e.g. DeadlockDetected) for up to max_transaction_retry_time
+        _driver = GraphDatabase.driver(
+            NEO4J_URI,
+            auth=(NEO4J_USER, NEO4J_PASSWORD),
+            max_connection_pool_size=64,
+            connection_acquisition_timeout=120,
+            max_transaction_retry_time=60,
+            keep_alive=True,
+        )
+    return _driver
+
+
+def close_driver():
+    """Close the shared driver if it has been created."""
+    global _driver
+    if _driver is not None:
+        _driver.close()
+        _driver = None
+
+
+atexit.register(close_driver)
@@ -2,111 +2,257 @@
 Ingest Warframe data into Neo4j graph database.
 Loads Weapons, Resources, and Recipes with their relationships.
 """
-from neo4j import GraphDatabase
-import json
+from concurrent.futures import ThreadPoolExecutor
+import csv
 import os
 import sys
-from typing import List, Dict, Any
-from pydantic import ValidationError
+from typing import List, Dict, Any, Type
+from neo4j.exceptions import ClientError
+from pydantic import BaseModel, ValidationError
+from tqdm import tqdm
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD, NEO4J_DATABASE
-from graph.models import WeaponNode, ResourceNode, RecipeNode
+from config import NEO4J_DATABASE
+try:
+    from config import NEO4J_IMPORT_DIR
+except ImportError:
+    NEO4J_IMPORT_DIR = None
+from graph.connection import get_driver
+from ingestion.data_downloader import read_manifest
+from graph.models import (
+    WeaponNode, ResourceNode, RecipeNode,
+    WeaponExport, ResourceExport, RecipeExport,
+)
+
+# Rows sent per UNWIND query (node batches are split across the writer threads)
+NODE_BATCH_SIZE = 2000
+RELATIONSHIP_BATCH_SIZE = 10000
+# Writer threads used for node ingestion
+INGEST_WORKERS = 8
+
+# Node properties written to Neo4j, computed once per model
+_WEAPON_PROP_FIELDS = tuple(n for n in WeaponNode.model_fields if n != 'uniqueName')
+_RESOURCE_PROP_FIELDS = tuple(n for n in ResourceNode.model_fields if n != 'uniqueName')
+# Ingredients become relationships rather than properties
+_RECIPE_PROP_FIELDS = tuple(
+    n for n in RecipeNode.model_fields if n not in ('uniqueName', 'ingredients', 'secretIngredients')
+)
+
+# Errors caused by the rows themselves (e.g. a map-valued property), as opposed
+# to transient or connection errors; the offending rows are skipped and reported
+_ROW_ERRORS = (ClientError, TypeError, ValueError)
+
+# Rows committed per transaction by LOAD CSV in the bulk load path
+BULK_COMMIT_SIZE = 5000
+# Cypher casts applied to LOAD CSV strings, by the Python type of the column's values
+_CSV_CASTS = {bool: "toBoolean({})", int: "toInteger({})", float: "toFloat({})", str: "{}"}
+
+# Constraints and indexes from schema.md, created before any MERGE
+SCHEMA_STATEMENTS = [
+    "CREATE CONSTRAINT weapon_unique IF NOT EXISTS FOR (w:Weapon) REQUIRE w.uniqueName IS UNIQUE",
+    "CREATE CONSTRAINT resource_unique IF NOT EXISTS FOR (r:Resource) REQUIRE r.uniqueName IS UNIQUE",
+    "CREATE CONSTRAINT recipe_unique IF NOT EXISTS FOR (bp:Recipe) REQUIRE bp.uniqueName IS UNIQUE",
+    "CREATE CONSTRAINT category_unique IF NOT EXISTS FOR (c:Category) REQUIRE c.name IS UNIQUE",
+    "CREATE INDEX weapon_name IF NOT EXISTS FOR (w:Weapon) ON (w.name)",
+    "CREATE INDEX resource_name IF NOT EXISTS FOR (r:Resource) ON (r.name)",
+    "CREATE INDEX weapon_category IF NOT EXISTS FOR (w:Weapon) ON (w.productCategory)",
+]
+
+# ==================== CYPHER QUERIES ====================
+# Kept as module constants so every batch sends identical query text
+
+# Node upserts per label; the ON MATCH clause is left out when the graph is known to be empty
+_NODE_LABELS = ("Resource", "Weapon", "Recipe")
+_MERGE_NODES_TEMPLATE = """
+    UNWIND $rows AS row
+    MERGE (n:{label} {{uniqueName: row.uniqueName}})
+    ON CREATE SET n += row.props{on_match}
+    RETURN count(*) AS cnt
+"""
+_UPSERT_NODES = {
+    label: _MERGE_NODES_TEMPLATE.format(label=label, on_match="\n    ON MATCH SET n += row.props")
+    for label in _NODE_LABELS
+}
+_CREATE_NODES = {label: _MERGE_NODES_TEMPLATE.format(label=label, on_match="") for label in _NODE_LABELS}
+
+_MERGE_CATEGORIES = """
+    UNWIND $names AS name
+    MERGE (c:Category {name: name})
+"""
+
+# Index-backed join on Category.name
+_LINK_WEAPON_CATEGORIES = """
+    MATCH (w:Weapon) WHERE w.productCategory IS NOT NULL
+    MATCH (c:Category {name: w.productCategory})
+    MERGE (w)-[:BELONGS_TO]->(c)
+"""
+
+# Both lookups are labelled so they use the uniqueness indexes; Weapon takes precedence
+_MERGE_BUILDS = """
+    UNWIND $rows AS row
+    MATCH (recipe:Recipe {uniqueName: row.recipe})
+    OPTIONAL MATCH (weapon:Weapon {uniqueName: row.target})
+    OPTIONAL MATCH (resource:Resource {uniqueName: row.target})
+    WITH recipe, row, coalesce(weapon, resource) AS item
+    WHERE item IS NOT NULL
+    MERGE (recipe)-[b:BUILDS]->(item)
+    SET b.quantity = row.qty
+    RETURN count(*) AS cnt
+"""
+
+_MERGE_REQUIRES = """
+    UNWIND $rows AS row
+    MATCH (recipe:Recipe {uniqueName: row.recipe})
+    MATCH (resource:Resource {uniqueName: row.item})
+    MERGE (recipe)-[r:REQUIRES]->(resource)
+    SET r.quantity = row.qty
+    RETURN count(*) AS cnt
+"""
+
+
+def _chunks(rows: List[Any], size: int):
+    """Yield successive slices of rows with at most size items"""
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _node_props(node: BaseModel, fields: tuple) -> Dict[str, Any]:
+    """Non-None values of the given fields plus any extra API fields.
+    
+    Equivalent to model_dump(exclude=..., exclude_none=True) for our flat
+    models, without re-walking the pydantic schema for every row.
+    """
+    values = node.__dict__
+    props = {k: values[k] for k in fields if values[k] is not None}
+    if node.__pydantic_extra__:
+        props.update((k, v) for k, v in node.__pydantic_extra__.items() if v is not None)
+    return props
+
+
+def _run_batch(tx, query: str, rows: List[Dict[str, Any]]) -> int:
+    """Transaction function running one UNWIND batch"""
+    return tx.run(query, rows=rows).single()['cnt']
+
+
+def _run_query(tx, query: str, **params):
+    """Transaction function running a single statement to completion"""
+    tx.run(query, **params).consume()
+
 
 class Neo4jIngestion:
     def __init__(self):
-        self.driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+        self.driver = get_driver()
         self.data_dir = "data_raw"
+        # True right after clear_database, so node MERGEs can skip ON MATCH updates
+        self.graph_empty = False
         
     def close(self):
-        self.driver.close()
+        """Drop this instance's reference to the shared driver.
+        
+        The driver itself is shared process-wide and closed at exit by graph.connection.
+        """
+        self.driver = None
     
     def clear_database(self):
         """Clear all nodes and relationships (use with caution!)"""
         with self.driver.session(database=NEO4J_DATABASE) as session:
             session.run("MATCH (n) DETACH DELETE n")
             print("✓ Database cleared")
+        self.graph_empty = True
+    
+    def create_schema(self):
+        """Create uniqueness constraints and indexes (see schema.md) so MERGE uses index lookups"""
+        with self.driver.session(database=NEO4J_DATABASE) as session:
+            for statement in SCHEMA_STATEMENTS:
+                session.run(statement).consume()
+        print(f"✓ Schema ready ({len(SCHEMA_STATEMENTS)} constraints/indexes)")
+    
+    def _load_export(self, filename: str, key: str, export_model: Type[BaseModel],
+                     node_model: Type[BaseModel]) -> List[BaseModel]:
+        """Parse and validate one export file in a single pass.
+        
+        Reads the zstd-compressed filename.zst written by data_downloader,
+        falling back to an uncompressed filename from older downloads.
+        Entries that fail validation come back as raw values; non-object entries
+        are skipped and the rest are validated again, to report why they are skipped.
+        """
+        filepath = os.path.join(self.data_dir, filename)
+        
+        if os.path.exists(filepath + '.zst'):
+            raw = read_manifest(filepath + '.zst')
+        else:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+        
+        nodes = []
+        for entry in getattr(export_model.model_validate_json(raw), key):
+            if isinstance(entry, node_model):
+                nodes.append(entry)
+                continue
+            if not isinstance(entry, dict):
+                print(f"  Warning: Skipping non-object {node_model.__name__} entry: {entry!r:.80}")
+                continue
+            try:
+                nodes.append(node_model(**entry))
+            except ValidationError as e:
+                print(f"  Warning: Validation error for {node_model.__name__}: {entry.get('uniqueName', 'unknown')}")
+                print(f"    Error details: {e}")
+        return nodes
     
     # ==================== RESOURCE INGESTION ====================
     
+    def _prepare_resources(self) -> List[Dict[str, Any]]:
+        """Validate ExportResources_en.json into node rows"""
+        resources = self._load_export("ExportResources_en.json", "ExportResources", ResourceExport, ResourceNode)
+        print(f"\nIngesting {len(resources)} resources...")
+        
+        return [
+            {"uniqueName": resource.uniqueName, "props": _node_props(resource, _RESOURCE_PROP_FIELDS)}
+            for resource in resources
+        ]
+    
     def ingest_resources(self):
         """Load all resources from ExportResources_en.json"""
-        filepath = os.path.join(self.data_dir, "ExportResources_en.json")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        rows = self._prepare_resources()
         
-        resources = data.get("ExportResources", [])
-        print(f"\nIngesting {len(resources)} resources...")
+        # Create nodes in Neo4j with all fields
+        count = self._ingest_nodes(self._merge_nodes_query("Resource"), rows, label="resources")
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for i, resource_data in enumerate(resources):
-                try:
-                    # Validate with Pydantic
-                    resource = ResourceNode(**resource_data)
-                    
-                    # Create node in Neo4j with all fields
-                    session.run("""
-                        MERGE (r:Resource {uniqueName: $uniqueName})
-                        SET r += $props
-                    """, uniqueName=resource.uniqueName, props=resource.model_dump(exclude={'uniqueName'}, exclude_none=True))
-                    
-                    if (i + 1) % 500 == 0:
-                        print(f"  Processed {i + 1}/{len(resources)} resources...")
-                        
-                except ValidationError as e:
-                    print(f"  Warning: Validation error for resource: {resource_data.get('uniqueName', 'unknown')}")
-                    print(f"    Error details: {e}")
-                except Exception as e:
-                    print(f"  Error ingesting resource: {e}")
-        
-        print(f"✓ Ingested {len(resources)} resources")
+        print(f"✓ Ingested {count} resources")
     
     # ==================== WEAPON INGESTION ====================
     
-    def ingest_weapons(self):
-        """Load all weapons from ExportWeapons_en.json"""
-        filepath = os.path.join(self.data_dir, "ExportWeapons_en.json")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        weapons = data.get("ExportWeapons", [])
+    def _prepare_weapons(self):
+        """Validate ExportWeapons_en.json into node rows and the set of categories"""
+        weapons = self._load_export("ExportWeapons_en.json", "ExportWeapons", WeaponExport, WeaponNode)
         print(f"\nIngesting {len(weapons)} weapons...")
         
         categories = set()
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for i, weapon_data in enumerate(weapons):
-                try:
-                    # Validate with Pydantic
-                    weapon = WeaponNode(**weapon_data)
-                    
-                    # Create weapon node with all fields
-                    weapon_dict = weapon.model_dump(exclude_none=True)
-                    # Convert damagePerShot list to string for storage (Neo4j doesn't handle lists well in SET +=)
-                    if 'damagePerShot' in weapon_dict and weapon_dict['damagePerShot']:
-                        weapon_dict['damagePerShot'] = str(weapon_dict['damagePerShot'])
-                    
-                    session.run("""
-                        MERGE (w:Weapon {uniqueName: $uniqueName})
-                        SET w += $props
-                    """, uniqueName=weapon.uniqueName, props={k: v for k, v in weapon_dict.items() if k != 'uniqueName'})
-                    
-                    # Track category for creating category nodes
-                    if weapon.productCategory:
-                        categories.add(weapon.productCategory)
-                    
-                    if (i + 1) % 100 == 0:
-                        print(f"  Processed {i + 1}/{len(weapons)} weapons...")
-                        
-                except ValidationError as e:
-                    print(f"  Warning: Validation error for weapon: {weapon_data.get('name', 'unknown')}")
-                except Exception as e:
-                    print(f"  Error ingesting weapon: {e}")
-        
-        print(f"✓ Ingested {len(weapons)} weapons")
+        rows = []
+        for weapon in weapons:
+            props = _node_props(weapon, _WEAPON_PROP_FIELDS)
+            # Convert damagePerShot list to string for storage (Neo4j doesn't handle lists well in SET +=)
+            damage_per_shot = props.get('damagePerShot')
+            if damage_per_shot:
+                props['damagePerShot'] = str(damage_per_shot)
+            rows.append({"uniqueName": weapon.uniqueName, "props": props})
+            
+            # Track category for creating category nodes
+            if weapon.productCategory:
+                categories.add(weapon.productCategory)
+        
+        return rows, categories
+    
+    def ingest_weapons(self):
+        """Load all weapons from ExportWeapons_en.json"""
+        rows, categories = self._prepare_weapons()
+        
+        # Create weapon nodes with all fields
+        count = self._ingest_nodes(self._merge_nodes_query("Weapon"), rows, label="weapons")
+        
+        print(f"✓ Ingested {count} weapons")
         
         # Create category nodes and relationships
         self._create_weapon_categories(categories)
@@ -116,119 +262,127 @@ class Neo4jIngestion:
         print(f"\nCreating {len(categories)} weapon categories...")
         
         with self.driver.session(database=NEO4J_DATABASE) as session:
-            for category in categories:
-                # Create category node
-                session.run("""
-                    MERGE (c:Category {name: $name})
-                """, name=category)
-                
-                # Link weapons to category
-                session.run("""
-                    MATCH (w:Weapon {productCategory: $category})
-                    MATCH (c:Category {name: $category})
-                    MERGE (w)-[:BELONGS_TO]->(c)
-                """, category=category)
+            # Create all category nodes in one statement
+            session.execute_write(_run_query, _MERGE_CATEGORIES, names=list(categories))
+            
+            # Link every weapon to its category
+            session.execute_write(_run_query, _LINK_WEAPON_CATEGORIES)
         
         print(f"✓ Created {len(categories)} categories and linked weapons")
     
     # ==================== RECIPE INGESTION ====================
     
+    def _prepare_recipes(self):
+        """Validate ExportRecipes_en.json into node rows and the validated recipes"""
+        recipes = self._load_export("ExportRecipes_en.json", "ExportRecipes", RecipeExport, RecipeNode)
+        print(f"\nIngesting {len(recipes)} recipes...")
+        
+        # All fields except ingredients, which become relationships
+        rows = [
+            {"uniqueName": recipe.uniqueName, "props": _node_props(recipe, _RECIPE_PROP_FIELDS)}
+            for recipe in recipes
+        ]
+        return rows, recipes
+    
     def ingest_recipes(self):
         """Load all recipes from ExportRecipes_en.json"""
-        filepath = os.path.join(self.data_dir, "ExportRecipes_en.json")
+        rows, recipes = self._prepare_recipes()
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Create recipe nodes with all fields
+        count = self._ingest_nodes(self._merge_nodes_query("Recipe"), rows, label="recipes")
         
-        recipes = data.get("ExportRecipes", [])
-        print(f"\nIngesting {len(recipes)} recipes...")
+        print(f"✓ Ingested {count} recipes")
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for i, recipe_data in enumerate(recipes):
-                try:
-                    # Validate with Pydantic
-                    recipe = RecipeNode(**recipe_data)
-                    
-                    # Create recipe node with all fields (except ingredients which are relationships)
-                    session.run("""
-                        MERGE (r:Recipe {uniqueName: $uniqueName})
-                        SET r += $props
-                    """, uniqueName=recipe.uniqueName, 
-                        props=recipe.model_dump(exclude={'uniqueName', 'ingredients', 'secretIngredients'}, exclude_none=True))
-                    
-                    if (i + 1) % 500 == 0:
-                        print(f"  Processed {i + 1}/{len(recipes)} recipes...")
-                        
-                except ValidationError as e:
-                    print(f"  Warning: Validation error for recipe: {recipe_data.get('uniqueName', 'unknown')}")
-                    print(f"    Error details: {e}")
-                except Exception as e:
-                    print(f"  Error ingesting recipe: {e}")
-        
-        print(f"✓ Ingested {len(recipes)} recipes")
-        
-        # Create relationships after all nodes exist
+        # Create relationships after all nodes exist (from the already-validated recipes)
         self._create_recipe_relationships(recipes)
     
-    def _create_recipe_relationships(self, recipes: List[Dict[str, Any]]):
+    def _create_recipe_relationships(self, recipes: List[RecipeNode]):
         """Create REQUIRES and BUILDS relationships for recipes"""
         print(f"\nCreating recipe relationships...")
         
-        requires_count = 0
-        builds_count = 0
+        builds_rows = [
+            {"recipe": r.uniqueName, "target": r.resultType, "qty": 1 if r.num is None else r.num}
+            for r in recipes if r.resultType
+        ]
+        requires_rows = [
+            {"recipe": r.uniqueName, "item": ing.get('ItemType'), "qty": ing.get('ItemCount', 1)}
+            for r in recipes for ing in (r.ingredients or []) if ing.get('ItemType')
+        ]
         
         with self.driver.session(database=NEO4J_DATABASE) as session:
-            for recipe_data in recipes:
-                recipe_unique = recipe_data.get('uniqueName')
-                result_type = recipe_data.get('resultType')
-                ingredients = recipe_data.get('ingredients', [])
-                
-                # Create BUILDS relationship (Recipe -> Weapon/Resource)
-                if result_type:
-                    # Try matching with Weapon first
-                    result = session.run("""
-                        MATCH (recipe:Recipe {uniqueName: $recipeUnique})
-                        MATCH (item:Weapon {uniqueName: $resultType})
-                        MERGE (recipe)-[:BUILDS {quantity: $quantity}]->(item)
-                        RETURN count(*) as cnt
-                    """, recipeUnique=recipe_unique, resultType=result_type, 
-                         quantity=recipe_data.get('num', 1))
-                    
-                    if result.single()['cnt'] == 0:
-                        # Try Resource if Weapon didn't match
-                        result = session.run("""
-                            MATCH (recipe:Recipe {uniqueName: $recipeUnique})
-                            MATCH (item:Resource {uniqueName: $resultType})
-                            MERGE (recipe)-[:BUILDS {quantity: $quantity}]->(item)
-                            RETURN count(*) as cnt
-                        """, recipeUnique=recipe_unique, resultType=result_type,
-                             quantity=recipe_data.get('num', 1))
-                        
-                        if result.single()['cnt'] > 0:
-                            builds_count += 1
-                    else:
-                        builds_count += 1
-                
-                # Create REQUIRES relationships (Recipe -> Resource/Component)
-                for ingredient in ingredients:
-                    item_type = ingredient.get('ItemType')
-                    item_count = ingredient.get('ItemCount', 1)
-                    
-                    if item_type:
-                        # Try matching with Resource
-                        result = session.run("""
-                            MATCH (recipe:Recipe {uniqueName: $recipeUnique})
-                            MATCH (resource:Resource {uniqueName: $itemType})
-                            MERGE (recipe)-[:REQUIRES {quantity: $quantity}]->(resource)
-                            RETURN count(*) as cnt
-                        """, recipeUnique=recipe_unique, itemType=item_type, quantity=item_count)
-                        
-                        if result.single()['cnt'] > 0:
-                            requires_count += 1
+            # Create BUILDS relationships (Recipe -> Weapon, falling back to Resource)
+            builds_count = self._run_batches(session, _MERGE_BUILDS, builds_rows)
+            
+            # Create REQUIRES relationships (Recipe -> Resource/Component)
+            requires_count = self._run_batches(session, _MERGE_REQUIRES, requires_rows)
         
         print(f"✓ Created {builds_count} BUILDS relationships")
         print(f"✓ Created {requires_count} REQUIRES relationships")
     
+    def _merge_nodes_query(self, label: str) -> str:
+        """UNWIND MERGE query for label nodes.
+        
+        New nodes take their properties in ON CREATE SET. Existing nodes are
+        updated in ON MATCH SET, which is dropped when the graph is known to be
+        empty so Neo4j has no per-property changes to track.
+        """
+        return (_CREATE_NODES if self.graph_empty else _UPSERT_NODES)[label]
+    
+    def _ingest_nodes(self, query: str, rows: List[Dict[str, Any]], label: str) -> int:
+        """Run a node UNWIND query over rows from several writer threads.
+        
+        Rows are sharded by uniqueName so two threads never MERGE the same key,
+        and each thread uses its own session from the shared driver.
+        """
+        shards = [[] for _ in range(INGEST_WORKERS)]
+        for row in rows:
+            shards[hash(row['uniqueName']) % INGEST_WORKERS].append(row)
+        
+        # Keep the total number of rows in flight roughly constant
+        batch_size = max(1, NODE_BATCH_SIZE // INGEST_WORKERS)
+        
+        # One bar per stage, advanced once per committed batch
+        with tqdm(total=len(rows), unit=label, desc=f"  {label}") as progress:
+            with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as pool:
+                results = pool.map(
+                    lambda shard: self._ingest_shard(query, shard, batch_size, progress),
+                    [shard for shard in shards if shard],
+                )
+                return sum(results)
+    
+    def _ingest_shard(self, query: str, rows: List[Dict[str, Any]], batch_size: int, progress=None) -> int:
+        """Ingest one shard of rows in a session owned by the calling thread"""
+        with self.driver.session(database=NEO4J_DATABASE) as session:
+            return self._run_batches(session, query, rows, batch_size, progress)
+    
+    def _run_batches(self, session, query: str, rows: List[Dict[str, Any]],
+                     batch_size: int = RELATIONSHIP_BATCH_SIZE, progress=None) -> int:
+        """Run an UNWIND query over rows, one write transaction per batch.
+        
+        Returns the summed `cnt` column of every batch. If given, the tqdm
+        progress bar is advanced by each committed batch.
+        """
+        total = 0
+        for chunk in _chunks(rows, batch_size):
+            try:
+                total += session.execute_write(_run_batch, query, chunk)
+            except _ROW_ERRORS:
+                # One bad row rejects its whole batch; retry row by row so only it is skipped
+                total += self._run_rows(session, query, chunk)
+            if progress is not None:
+                progress.update(len(chunk))
+        return total
+    
+    def _run_rows(self, session, query: str, rows: List[Dict[str, Any]]) -> int:
+        """Run an UNWIND query one row at a time, skipping rows Neo4j rejects"""
+        total = 0
+        for row in rows:
+            try:
+                total += session.execute_write(_run_batch, query, [row])
+            except _ROW_ERRORS as e:
+                print(f"  Error ingesting {row.get('uniqueName') or row.get('recipe', 'unknown')}: {e}")
+        return total
+    
     # ==================== MAIN INGESTION ====================
     
     def ingest_all(self, clear_first=False):
@@ -238,16 +392,16 @@ class Neo4jIngestion:
         print("=" * 60)
         
         if clear_first:
-            response = input("\n⚠️  Clear all existing data? (yes/no): ")
-            if response.lower() == 'yes':
-                self.clear_database()
-            else:
-                print("Skipping database clear...")
+            self._confirm_clear()
+        
+        # Constraints first so every MERGE below is an index lookup
+        self.create_schema()
         
         # Ingest in order: Resources -> Weapons -> Recipes (so relationships work)
         self.ingest_resources()
         self.ingest_weapons()
         self.ingest_recipes()
+        self.graph_empty = False
         
         print("\n" + "=" * 60)
         print("✓ Ingestion Complete!")
@@ -256,6 +410,111 @@ class Neo4jIngestion:
         # Print summary
         self.print_summary()
     
+    def ingest_all_bulk(self, clear_first=False):
+        """Initial bulk load: nodes via CSV files and LOAD CSV, relationships via UNWIND.
+        
+        Requires NEO4J_IMPORT_DIR in config.py to point at the Neo4j import
+        directory. Use ingest_all for incremental updates.
+        """
+        if not NEO4J_IMPORT_DIR:
+            raise RuntimeError("Set NEO4J_IMPORT_DIR in config.py to the Neo4j import directory")
+        
+        print("=" * 60)
+        print("Starting Warframe Bulk Data Ingestion")
+        print("=" * 60)
+        
+        if clear_first:
+            self._confirm_clear()
+        
+        self.create_schema()
+        
+        # Ingest in order: Resources -> Weapons -> Recipes (so relationships work)
+        rows = self._prepare_resources()
+        self._bulk_load_nodes("Resource", _RESOURCE_PROP_FIELDS, rows, "resources.csv")
+        
+        rows, categories = self._prepare_weapons()
+        self._bulk_load_nodes("Weapon", _WEAPON_PROP_FIELDS, rows, "weapons.csv")
+        self._create_weapon_categories(categories)
+        
+        rows, recipes = self._prepare_recipes()
+        self._bulk_load_nodes("Recipe", _RECIPE_PROP_FIELDS, rows, "recipes.csv")
+        self._create_recipe_relationships(recipes)
+        self.graph_empty = False
+        
+        print("\n" + "=" * 60)
+        print("✓ Bulk Ingestion Complete!")
+        print("=" * 60)
+        
+        self.print_summary()
+    
+    def _bulk_load_nodes(self, label: str, prop_fields: tuple, rows: List[Dict[str, Any]], filename: str):
+        """Write node rows to a CSV in the import directory and MERGE them with LOAD CSV.
+        
+        A column goes through the CSV only if all of its values share one scalar
+        type, so it can be cast back exactly; anything else (lists, maps, mixed
+        types, empty strings) is written afterwards with the regular UNWIND upsert,
+        so both ingest paths build the same graph.
+        """
+        # Value types seen per column: model fields first, then extra API fields
+        seen = {n: set() for n in prop_fields}
+        for row in rows:
+            for key, value in row['props'].items():
+                seen.setdefault(key, set()).add(type(value))
+        casts = {}
+        for column, types in seen.items():
+            if len(types) == 1:
+                (value_type,) = types
+                if value_type in _CSV_CASTS:
+                    casts[column] = _CSV_CASTS[value_type]
+        
+        remaining_rows = []
+        filepath = os.path.join(NEO4J_IMPORT_DIR, filename)
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=['uniqueName'] + list(casts), restval='')
+            writer.writeheader()
+            for row in rows:
+                csv_props, rest = {}, {}
+                for key, value in row['props'].items():
+                    # Empty cells read back as null, so empty strings take the UNWIND path
+                    if key in casts and value != '':
+                        csv_props[key] = value
+                    else:
+                        rest[key] = value
+                writer.writerow({'uniqueName': row['uniqueName'], **csv_props})
+                if rest:
+                    remaining_rows.append({"uniqueName": row['uniqueName'], "props": rest})
+        
+        # LOAD CSV yields strings (empty cells are null), so cast each column back
+        assignments = ",\n                ".join(
+            f"n.`{column}` = {cast.format(f'row.`{column}`')}" for column, cast in casts.items()
+        )
+        set_clause = f"SET {assignments}" if casts else ""
+        query = f"""
+            LOAD CSV WITH HEADERS FROM 'file:///{filename}' AS row
+            CALL {{
+                WITH row
+                MERGE (n:{label} {{uniqueName: row.uniqueName}})
+                {set_clause}
+            }} IN TRANSACTIONS OF {BULK_COMMIT_SIZE} ROWS
+        """
+        
+        # CALL ... IN TRANSACTIONS must run in an auto-commit transaction
+        with self.driver.session(database=NEO4J_DATABASE) as session:
+            session.run(query).consume()
+        
+        print(f"✓ Bulk loaded {len(rows)} {label} nodes from {filename}")
+        
+        if remaining_rows:
+            self._ingest_nodes(_UPSERT_NODES[label], remaining_rows, label=f"{label} non-CSV properties")
+    
+    def _confirm_clear(self):
+        """Ask before clearing the database"""
+        response = input("\n⚠️  Clear all existing data? (yes/no): ")
+        if response.lower() == 'yes':
+            self.clear_database()
+        else:
+            print("Skipping database clear...")
+    
     def print_summary(self):
         """Print database statistics"""
         with self.driver.session(database=NEO4J_DATABASE) as session:
@@ -1,7 +1,7 @@
 """
 Pydantic models for Warframe data validation and graph node representation.
 """
-from typing import Optional, List, Dict, Any
+from typing import Annotated, Optional, List, Dict, Any, Union
 from pydantic import BaseModel, Field
 
 
@@ -85,6 +85,26 @@ class RecipeNode(BaseModel):
         extra = "allow"
 
 
+# Export file models (top level of the ExportX_en.json manifests).
+# Other top-level keys, e.g. ExportRailjackWeapons, are ignored.
+# Entries that fail node validation are kept as raw values (dicts, or anything
+# else that is not an object) so the whole file is still validated in one pass
+# and bad entries can be reported afterwards.
+class WeaponExport(BaseModel):
+    """Contents of ExportWeapons_en.json."""
+    ExportWeapons: List[Annotated[Union[WeaponNode, Dict[str, Any], Any], Field(union_mode="left_to_right")]] = []
+
+
+class ResourceExport(BaseModel):
+    """Contents of ExportResources_en.json."""
+    ExportResources: List[Annotated[Union[ResourceNode, Dict[str, Any], Any], Field(union_mode="left_to_right")]] = []
+
+
+class RecipeExport(BaseModel):
+    """Contents of ExportRecipes_en.json."""
+    ExportRecipes: List[Annotated[Union[RecipeNode, Dict[str, Any], Any], Field(union_mode="left_to_right")]] = []
+
+
 class RecipeIngredient(BaseModel):
     """Represents an ingredient in a recipe."""
     ItemType: str = Field(..., description="uniqueName of the required resource")
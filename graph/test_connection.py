@@ -1,18 +1,17 @@
 """
 Test Neo4j connection
 """
-from neo4j import GraphDatabase
 import sys
 import os
 
 # Add parent directory to path to import config
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from config import NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+from graph.connection import get_driver
 
 def test_connection():
     """Test connection to Neo4j database."""
     try:
-        driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+        driver = get_driver()
         
         # Connect to the specific database
         with driver.session(database="warframebotdata") as session:
@@ -26,7 +25,6 @@ def test_connection():
             for record in result:
                 print(f"✓ Neo4j {record['name']}: {record['versions'][0]} ({record['edition']})")
         
-        driver.close()
         print("\n✓ All tests passed! Ready to ingest data.")
         return True
         
@@ -1,7 +1,27 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import os
 import lzma
+import zstandard
+from concurrent.futures import ThreadPoolExecutor
+
+# Manifests are I/O bound, so download several at once
+DOWNLOAD_WORKERS = 16
+
+# zstd level for manifests stored on disk
+ZSTD_LEVEL = 3
+
+# Shared HTTP session: keeps connections alive across downloads and retries transient failures
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=DOWNLOAD_WORKERS,
+    pool_maxsize=DOWNLOAD_WORKERS,
+    max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
 
 def decompress_index(index_path):
     """Read the index file and return the list of manifest paths."""
@@ -14,26 +34,47 @@ def get_manifest_url(manifest_path):
     base_url = "http://content.warframe.com/PublicExport/Manifest/"
     return base_url + manifest_path
 
-def download_manifest_json(manifest_path, save_path=None):
-    """Download and parse the JSON data for a given manifest path.
+def save_manifest(manifest_path, save_path, chunk_size=1 << 20):
+    """Stream a manifest straight to disk, zstd-compressed, without parsing it.
     
     Args:
         manifest_path (str): The manifest path from the index, e.g., 'ExportWeapons_en.json!hash'
-        save_path (str, optional): If provided, save the JSON to this file path.
-    
-    Returns:
-        dict: The parsed JSON data.
+        save_path (str): File path to write the compressed JSON to, e.g. 'ExportWeapons_en.json.zst'.
+        chunk_size (int): Bytes written per chunk.
     """
     url = get_manifest_url(manifest_path)
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
-    
-    if save_path:
-        with open(save_path, 'w') as f:
-            json.dump(data, f, indent=2)
+    cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    # Write to a temporary file so a dropped connection never replaces the last good copy
+    part_path = save_path + '.part'
+    try:
+        with _SESSION.get(url, stream=True) as response:
+            response.raise_for_status()
+            with open(part_path, 'wb') as f, cctx.stream_writer(f, closefd=False) as writer:
+                for chunk in response.iter_content(chunk_size):
+                    writer.write(chunk)
+        os.replace(part_path, save_path)
+    finally:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+def read_manifest(path):
+    """Return the raw JSON bytes of a manifest saved by save_manifest."""
+    dctx = zstandard.ZstdDecompressor()
+    with open(path, 'rb') as f, dctx.stream_reader(f) as reader:
+        return reader.read()
+
+def download_manifest(manifest):
+    """Download one manifest into data_raw, reporting success or failure."""
+    # Derive filename by removing the hash part (e.g., 'ExportWeapons_en.json!hash' -> 'ExportWeapons_en.json.zst')
+    filename = manifest.split('!')[0] + '.zst'
+    save_path = os.path.join('data_raw', filename)
     
-    return data
+    print(f"Downloading and saving {manifest} to {save_path}")
+    try:
+        save_manifest(manifest, save_path)
+        print(f"Successfully saved {filename}")
+    except Exception as e:
+        print(f"Failed to download {manifest}: {e}")
 
 def get_all_manifests(index_path='data_raw/index_en.txt'):
     """Get all available manifest paths from the decompressed index."""
@@ -65,21 +106,37 @@ def decompress_lzma(data):
     return b"".join(results)
 
 
+def valid_lzma_prefix_length(data):
+    """Length of the longest prefix of data that decompress_lzma accepts.
+    
+    A truncated prefix decodes without error while one reaching into the
+    corrupt bytes does not, so the boundary can be binary-searched with
+    O(log N) decompressions instead of trimming one byte at a time.
+    """
+    lo, hi = 0, len(data)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        try:
+            decompress_lzma(data[:mid])
+            lo = mid
+        except lzma.LZMAError:
+            hi = mid - 1
+    return lo
+
+
 def download_and_decompress(lang_code: str, output_dir: str):
     os.makedirs(output_dir, exist_ok=True)
 
     output_path = os.path.join(output_dir, f"index_{lang_code}.txt")
     url = f"https://origin.warframe.com/PublicExport/index_{lang_code}.txt.lzma"
-    response = requests.get(url)
+    response = _SESSION.get(url)
     byt = response.content
 
-    length = len(byt)
-    while True:
-        try:
-            decompressed_bytes = decompress_lzma(byt[:length])
-            break
-        except lzma.LZMAError:
-            length -= 1
+    try:
+        decompressed_bytes = decompress_lzma(byt)
+    except lzma.LZMAError:
+        # Trailing bytes are corrupt; keep the longest prefix that decodes
+        decompressed_bytes = decompress_lzma(byt[:valid_lzma_prefix_length(byt)])
 
     text = decompressed_bytes.decode("utf-8")
 
@@ -97,28 +154,18 @@ if __name__ == "__main__":
     manifests = get_all_manifests()
     print(f"Found {len(manifests)} manifests")
     
-    # Download and save each manifest as JSON
-    for manifest in manifests:
-        # Derive filename by removing the hash part (e.g., 'ExportWeapons_en.json!hash' -> 'ExportWeapons_en.json')
-        filename = manifest.split('!')[0]
-        save_path = os.path.join('data_raw', filename)
-        
-        print(f"Downloading and saving {manifest} to {save_path}")
-        try:
-            data = download_manifest_json(manifest, save_path)
-            print(f"Successfully saved {filename}")
-        except Exception as e:
-            print(f"Failed to download {manifest}: {e}")
+    # Download and save each manifest as zstd-compressed JSON, several at a time
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        list(pool.map(download_manifest, manifests))
     
     # Example: Load and inspect a specific manifest (e.g., weapons)
-    weapon_file = 'data_raw/ExportWeapons_en.json'
+    weapon_file = 'data_raw/ExportWeapons_en.json.zst'
     if os.path.exists(weapon_file):
-        with open(weapon_file, 'r') as f:
-            weapon_data = json.load(f)
+        weapon_data = orjson.loads(read_manifest(weapon_file))
         
         # Find a specific item
         for entry in weapon_data.get("ExportWeapons", []):
             if entry["name"] == "Lex Prime":
                 print("Found Lex Prime:")
-                print(json.dumps(entry, indent=4))
+                print(orjson.dumps(entry, option=orjson.OPT_INDENT_2).decode())
                 break
\ No newline at end of file